@@ -5,94 +5,294 @@ Handles RDS MySQL connections and data operations
 """
 
 import os
-import json
+import functools
 import logging
+import queue
+import tempfile
+import threading
+from collections import defaultdict
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple
 import pymysql
+from pymysql.constants import CLIENT, FIELD_TYPE
+from cachetools import TTLCache
 from contextlib import contextmanager
 
+try:
+    import orjson as _json_parser
+except ImportError:
+    import json as _json_parser
+
 logger = logging.getLogger(__name__)
 
-class DatabaseConfig:
-    """Database configuration management"""
-    
-    def __init__(self):
-        self.config = self._load_config()
-    
-    def _load_config(self) -> Dict:
-        """Load database configuration from environment or config file"""
-        # Try environment variables first (for production)
-        if os.getenv('RDS_HOSTNAME'):
-            return {
-                'host': os.getenv('RDS_HOSTNAME'),
-                'port': int(os.getenv('RDS_PORT', 3306)),
-                'database': os.getenv('RDS_DB_NAME', 'image_recognition'),
-                'username': os.getenv('RDS_USERNAME', 'admin'),
-                'password': os.getenv('RDS_PASSWORD'),
-                'charset': 'utf8mb4'
-            }
-        
-        # Fallback to config file (for development)
-        try:
-            with open('/var/www/html/deployment-info.json', 'r') as f:
-                deployment_config = json.load(f)
-                return {
-                    'host': deployment_config.get('rds_endpoint', 'localhost'),
-                    'port': int(deployment_config.get('rds_port', 3306)),
-                    'database': deployment_config.get('rds_database', 'image_recognition'),
-                    'username': deployment_config.get('rds_username', 'admin'),
-                    'password': deployment_config.get('rds_password', ''),
-                    'charset': 'utf8mb4'
-                }
-        except Exception as e:
-            logger.error(f"Failed to load database config: {e}")
-            # Default configuration for development
+# Decode DECIMAL columns (bbox coordinates, confidences) straight to float
+# so API payload assembly needs no per-value Decimal casts
+_CONVERSIONS = pymysql.converters.conversions.copy()
+_CONVERSIONS[FIELD_TYPE.DECIMAL] = float
+_CONVERSIONS[FIELD_TYPE.NEWDECIMAL] = float
+
+# Cached at module level - every DatabaseManager construction otherwise
+# pays the env lookups plus a disk read and JSON parse of the deployment file
+@functools.lru_cache(maxsize=1)
+def _load_db_config() -> Dict:
+    """Load database configuration from environment or config file"""
+    # Try environment variables first (for production)
+    if os.getenv('RDS_HOSTNAME'):
+        return {
+            'host': os.getenv('RDS_HOSTNAME'),
+            'port': int(os.getenv('RDS_PORT', 3306)),
+            'database': os.getenv('RDS_DB_NAME', 'image_recognition'),
+            'username': os.getenv('RDS_USERNAME', 'admin'),
+            'password': os.getenv('RDS_PASSWORD'),
+            'charset': 'utf8mb4'
+        }
+
+    # Fallback to config file (for development)
+    try:
+        with open('/var/www/html/deployment-info.json', 'rb') as f:
+            deployment_config = _json_parser.loads(f.read())
             return {
-                'host': 'localhost',
-                'port': 3306,
-                'database': 'image_recognition',
-                'username': 'root',
-                'password': '',
+                'host': deployment_config.get('rds_endpoint', 'localhost'),
+                'port': int(deployment_config.get('rds_port', 3306)),
+                'database': deployment_config.get('rds_database', 'image_recognition'),
+                'username': deployment_config.get('rds_username', 'admin'),
+                'password': deployment_config.get('rds_password', ''),
                 'charset': 'utf8mb4'
             }
+    except Exception as e:
+        logger.error(f"Failed to load database config: {e}")
+        # Default configuration for development
+        return {
+            'host': 'localhost',
+            'port': 3306,
+            'database': 'image_recognition',
+            'username': 'root',
+            'password': '',
+            'charset': 'utf8mb4'
+        }
+
+# Statement text built once at import instead of per call - the batched
+# save path otherwise re-allocates these literals for every image
+_SQL_INSERT_IMAGE = """
+    INSERT INTO images (s3_key, original_name, file_size, processing_status)
+    VALUES (%s, %s, %s, 'pending')
+"""
+
+_SQL_UPSERT_IMAGE = """
+    INSERT INTO images (s3_key, original_name, file_size, processing_status, processed_at)
+    VALUES (%s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        id = LAST_INSERT_ID(id),
+        processing_status = VALUES(processing_status),
+        processed_at = VALUES(processed_at),
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_SQL_UPDATE_STATUS = """
+    UPDATE images
+    SET processing_status = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s
+"""
+
+_SQL_UPDATE_STATUS_PROCESSED = """
+    UPDATE images
+    SET processing_status = %s, processed_at = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s
+"""
+
+_SQL_INSERT_FACE = """
+    INSERT INTO face_detections
+    (image_id, confidence, bbox_left, bbox_top, bbox_width, bbox_height,
+     age_low, age_high, gender, gender_confidence,
+     primary_emotion, emotion_confidence)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+_SQL_INSERT_LOG = """
+    INSERT INTO processing_logs
+    (image_id, process_type, status, message, processing_time_ms)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+# Pulls the four bbox fields in one C-level call per row
+_get_bbox = itemgetter('Left', 'Top', 'Width', 'Height')
+
 
 class DatabaseManager:
-    """Database connection and operations manager"""
-    
+    """Database connection and operations manager.
+
+    Connections are kept in a small bounded pool instead of being opened
+    and closed per call - each fresh connect costs TCP + TLS + MySQL auth
+    round trips to RDS, which dominates request latency on the hot paths.
+    """
+
+    # Longest an acquire may block on a full pool before failing loudly;
+    # well past the statement timeouts so a healthy-but-busy checkout is
+    # never mistaken for a stuck one
+    POOL_WAIT_TIMEOUT = 90
+
     def __init__(self):
-        self.config = DatabaseConfig().config
-        logger.info(f"Database config loaded: {self.config['host']}:{self.config['port']}")
-    
+        self.config = _load_db_config()
+        # Sized for an I/O-bound service: 2 x cores + 1
+        self.pool_size = (os.cpu_count() or 1) * 2 + 1
+        self._pool = queue.LifoQueue(maxsize=self.pool_size)
+        self._created = 0
+        self._pool_lock = threading.Lock()
+        # Short-TTL caches for idempotent reads - frontend status polling
+        # hits the same ids in bursts, so a 2s window collapses those to one
+        # query. Writers pop entries so status changes show immediately.
+        self._status_cache = TTLCache(maxsize=10_000, ttl=2.0)
+        self._image_cache = TTLCache(maxsize=10_000, ttl=2.0)
+        self._cache_lock = threading.Lock()
+        logger.info(f"Database config loaded: {self.config['host']}:{self.config['port']} "
+                    f"(pool size {self.pool_size})")
+
+    def _connect(self):
+        """Open a new database connection"""
+        return pymysql.connect(
+            host=self.config['host'],
+            port=self.config['port'],
+            user=self.config['username'],
+            password=self.config['password'],
+            database=self.config['database'],
+            charset=self.config['charset'],
+            autocommit=False,
+            cursorclass=pymysql.cursors.DictCursor,
+            conv=_CONVERSIONS,
+            connect_timeout=10,
+            read_timeout=60,
+            write_timeout=60,
+            local_infile=True,
+            client_flag=CLIENT.FOUND_ROWS
+        )
+
+    def _discard(self, connection):
+        """Close a broken connection and free its pool slot"""
+        with self._pool_lock:
+            self._created -= 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _acquire(self):
+        """Get a connection from the pool, creating one if under the cap"""
+        # Reuse an idle connection when one is available
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                # Detect sockets dropped by idle timeouts since last use
+                connection.ping(reconnect=True)
+                return connection
+            except Exception:
+                self._discard(connection)
+
+        # No idle connection - create one if the pool is not at capacity
+        with self._pool_lock:
+            under_cap = self._created < self.pool_size
+            if under_cap:
+                self._created += 1
+        if under_cap:
+            try:
+                return self._connect()
+            except Exception:
+                with self._pool_lock:
+                    self._created -= 1
+                raise
+
+        # Pool exhausted - wait for a connection to be released
+        try:
+            connection = self._pool.get(timeout=self.POOL_WAIT_TIMEOUT)
+        except queue.Empty:
+            raise RuntimeError(
+                f"Timed out after {self.POOL_WAIT_TIMEOUT}s waiting for a "
+                f"database connection (pool size {self.pool_size})"
+            )
+        try:
+            connection.ping(reconnect=True)
+            return connection
+        except Exception:
+            self._discard(connection)
+            with self._pool_lock:
+                self._created += 1
+            try:
+                return self._connect()
+            except Exception:
+                # Give the slot back, mirroring the under-cap branch -
+                # leaving _created high would shrink the pool for good
+                with self._pool_lock:
+                    self._created -= 1
+                raise
+
+    def _release(self, connection):
+        """Return a connection to the pool"""
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            self._discard(connection)
+
     @contextmanager
     def get_connection(self):
-        """Get database connection with automatic cleanup"""
-        connection = None
+        """Get a pooled database connection with automatic release"""
+        connection = self._acquire()
+        # No-op unless the connection last served a read checkout; PyMySQL
+        # only sends SET AUTOCOMMIT when the mode actually changes. When it
+        # does send and the socket is gone, drop the connection so the pool
+        # slot is freed rather than leaked.
+        try:
+            connection.autocommit(False)
+        except Exception:
+            self._discard(connection)
+            raise
         try:
-            connection = pymysql.connect(
-                host=self.config['host'],
-                port=self.config['port'],
-                user=self.config['username'],
-                password=self.config['password'],
-                database=self.config['database'],
-                charset=self.config['charset'],
-                autocommit=False,
-                cursorclass=pymysql.cursors.DictCursor
-            )
             yield connection
         except Exception as e:
-            if connection:
+            try:
                 connection.rollback()
+            except Exception:
+                # Connection is unusable - drop it instead of pooling it
+                self._discard(connection)
+                connection = None
             logger.error(f"Database connection error: {e}")
             raise
         finally:
-            if connection:
-                connection.close()
+            if connection is not None:
+                self._release(connection)
     
+    @contextmanager
+    def get_read_connection(self):
+        """Get a pooled connection for SELECT-only work.
+
+        Read checkouts run in autocommit mode: with autocommit off a
+        SELECT opens an implicit transaction, and re-pooling without a
+        commit would pin later reads on that connection to the original
+        REPEATABLE READ snapshot, hiding the Lambda's committed status
+        updates from the polling endpoints. The error path still skips
+        the rollback round trip get_connection pays before re-pooling;
+        stale sockets are caught by the ping on the next acquire.
+        """
+        connection = self._acquire()
+        try:
+            connection.autocommit(True)
+        except Exception:
+            self._discard(connection)
+            raise
+        try:
+            yield connection
+        except Exception as e:
+            logger.error(f"Database connection error: {e}")
+            raise
+        finally:
+            self._release(connection)
+
     def test_connection(self) -> bool:
         """Test database connectivity"""
         try:
-            with self.get_connection() as conn:
+            with self.get_read_connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute("SELECT 1")
                     result = cursor.fetchone()
@@ -105,12 +305,10 @@ class DatabaseManager:
         """Create new image record and return image ID"""
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    sql = """
-                    INSERT INTO images (s3_key, original_name, file_size, processing_status)
-                    VALUES (%s, %s, %s, 'pending')
-                    """
-                    cursor.execute(sql, (s3_key, original_name, file_size))
+                # Plain tuple cursor - write paths never read rows, so
+                # DictCursor's per-row dict building is wasted work
+                with conn.cursor(pymysql.cursors.Cursor) as cursor:
+                    cursor.execute(_SQL_INSERT_IMAGE, (s3_key, original_name, file_size))
                     image_id = cursor.lastrowid
                     conn.commit()
                     logger.info(f"Created image record: ID={image_id}, S3={s3_key}")
@@ -119,171 +317,320 @@ class DatabaseManager:
             logger.error(f"Failed to create image record: {e}")
             raise
     
+    def upsert_image(self, s3_key: str, original_name: str, file_size: int,
+                     status: str = 'pending', processed_at: datetime = None) -> int:
+        """Create or update an image record in a single round trip.
+
+        Replaces the INSERT-then-UPDATE pattern on the ingest path with
+        INSERT ... ON DUPLICATE KEY UPDATE. Requires a UNIQUE index on
+        images.s3_key; the LAST_INSERT_ID(id) clause makes lastrowid
+        return the existing row's id on the duplicate path.
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor(pymysql.cursors.Cursor) as cursor:
+                    cursor.execute(_SQL_UPSERT_IMAGE, (s3_key, original_name, file_size, status, processed_at))
+                    image_id = cursor.lastrowid
+                    conn.commit()
+                    self._invalidate_caches(image_id=image_id, s3_key=s3_key)
+                    logger.info(f"Upserted image record: ID={image_id}, S3={s3_key}")
+                    return image_id
+        except Exception as e:
+            logger.error(f"Failed to upsert image record: {e}")
+            raise
+
     def update_processing_status(self, image_id: int, status: str, processed_at: datetime = None):
         """Update image processing status"""
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
+                with conn.cursor(pymysql.cursors.Cursor) as cursor:
                     if processed_at:
-                        sql = """
-                        UPDATE images 
-                        SET processing_status = %s, processed_at = %s, updated_at = CURRENT_TIMESTAMP
-                        WHERE id = %s
-                        """
-                        cursor.execute(sql, (status, processed_at, image_id))
+                        cursor.execute(_SQL_UPDATE_STATUS_PROCESSED, (status, processed_at, image_id))
                     else:
-                        sql = """
-                        UPDATE images 
-                        SET processing_status = %s, updated_at = CURRENT_TIMESTAMP
-                        WHERE id = %s
-                        """
-                        cursor.execute(sql, (status, image_id))
+                        cursor.execute(_SQL_UPDATE_STATUS, (status, image_id))
                     conn.commit()
+                    self._invalidate_caches(image_id=image_id)
                     logger.info(f"Updated image {image_id} status to {status}")
         except Exception as e:
             logger.error(f"Failed to update processing status: {e}")
             raise
     
+    def _invalidate_caches(self, image_id=None, s3_key=None):
+        """Drop cached reads for an image after a write touches it"""
+        with self._cache_lock:
+            if image_id is not None:
+                self._status_cache.pop(image_id, None)
+            if s3_key is not None:
+                self._image_cache.pop(s3_key, None)
+
+    # Above this row count a multi-row INSERT is dominated by SQL parsing;
+    # stream the batch through LOAD DATA LOCAL INFILE instead
+    BULK_LOAD_THRESHOLD = 500
+
+    @staticmethod
+    def _executemany_chunked(cursor, sql, rows, chunk_size=1000):
+        """executemany in chunks so a huge batch stays under max_allowed_packet"""
+        for start in range(0, len(rows), chunk_size):
+            cursor.executemany(sql, rows[start:start + chunk_size])
+
+    @staticmethod
+    def _bulk_load(cursor, table, columns, rows):
+        """Stream rows into a table via LOAD DATA LOCAL INFILE.
+
+        Bypasses SQL parsing entirely, which is the bottleneck for very
+        wide batches (e.g. a backfill re-running Rekognition over many
+        images). Requires local_infile on both client (set in _connect)
+        and server.
+        """
+        def field(value):
+            if value is None:
+                return '\\N'
+            return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+        with tempfile.NamedTemporaryFile('w', suffix='.tsv', delete=False) as tsv:
+            for row in rows:
+                tsv.write('\t'.join(field(value) for value in row) + '\n')
+            path = tsv.name
+        try:
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} "
+                f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' "
+                f"({', '.join(columns)})",
+                (path,)
+            )
+        finally:
+            os.unlink(path)
+
+    def _insert_batch(self, cursor, table, columns, rows):
+        """Insert a batch of rows, picking the cheapest path for its size"""
+        if len(rows) > self.BULK_LOAD_THRESHOLD:
+            self._bulk_load(cursor, table, columns, rows)
+        else:
+            placeholders = ', '.join(['%s'] * len(columns))
+            self._executemany_chunked(
+                cursor,
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                rows
+            )
+
     def save_detection_results(self, image_id: int, rekognition_results: Dict):
-        """Save Rekognition detection results to database"""
+        """Save Rekognition detection results to database.
+
+        Rows for each table are collected first and inserted with a single
+        multi-row INSERT (executemany), so an image costs one round trip
+        per table rather than one per row. The whole save runs as one
+        transaction (pooled connections have autocommit off) with the
+        single commit below as its only sync point.
+        """
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    # Save general labels
-                    if 'labels' in rekognition_results:
-                        for label in rekognition_results['labels']:
-                            sql = """
-                            INSERT INTO detection_labels (image_id, label_name, confidence)
-                            VALUES (%s, %s, %s)
-                            """
-                            cursor.execute(sql, (image_id, label['Name'], label['Confidence']))
-                    
-                    # Save person detections
-                    if 'boundingBoxes' in rekognition_results:
-                        for person in rekognition_results['boundingBoxes']:
-                            bbox = person['boundingBox']
-                            sql = """
-                            INSERT INTO person_detections 
-                            (image_id, confidence, bbox_left, bbox_top, bbox_width, bbox_height)
-                            VALUES (%s, %s, %s, %s, %s, %s)
-                            """
-                            cursor.execute(sql, (
-                                image_id, person['confidence'],
-                                bbox['Left'], bbox['Top'], bbox['Width'], bbox['Height']
-                            ))
-                    
-                    # Save face detections
-                    if 'faceBoxes' in rekognition_results:
-                        for face in rekognition_results['faceBoxes']:
-                            bbox = face['boundingBox']
-                            
-                            # Extract face attributes
-                            age_low = face.get('ageRange', {}).get('Low')
-                            age_high = face.get('ageRange', {}).get('High')
-                            gender = face.get('gender', {}).get('Value')
-                            gender_conf = face.get('gender', {}).get('Confidence')
-                            
-                            # Get primary emotion
-                            emotions = face.get('emotions', [])
-                            primary_emotion = emotions[0]['Type'] if emotions else None
-                            emotion_conf = emotions[0]['Confidence'] if emotions else None
-                            
-                            # Insert face detection
-                            sql = """
-                            INSERT INTO face_detections 
-                            (image_id, confidence, bbox_left, bbox_top, bbox_width, bbox_height,
-                             age_low, age_high, gender, gender_confidence, 
-                             primary_emotion, emotion_confidence)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            """
-                            cursor.execute(sql, (
-                                image_id, face['confidence'],
-                                bbox['Left'], bbox['Top'], bbox['Width'], bbox['Height'],
-                                age_low, age_high, gender, gender_conf,
-                                primary_emotion, emotion_conf
-                            ))
-                            
-                            face_id = cursor.lastrowid
-                            
-                            # Insert all emotions for this face
-                            for emotion in emotions:
-                                sql = """
-                                INSERT INTO face_emotions (face_detection_id, emotion_type, confidence)
-                                VALUES (%s, %s, %s)
-                                """
-                                cursor.execute(sql, (face_id, emotion['Type'], emotion['Confidence']))
-                    
-                    conn.commit()
+                with conn.cursor(pymysql.cursors.Cursor) as cursor:
+                    # Suspend constraint checks for the bulk window - rows come
+                    # from a single Rekognition result for a known parent
+                    # image, so uniqueness/FK validation adds only overhead.
+                    # Restored in the finally before the connection is pooled.
+                    cursor.execute("SET SESSION unique_checks=0")
+                    cursor.execute("SET SESSION foreign_key_checks=0")
+                    try:
+                        self._save_detection_rows(cursor, image_id, rekognition_results)
+                        conn.commit()
+                        self._invalidate_caches(image_id=image_id)
+                    finally:
+                        try:
+                            cursor.execute("SET SESSION unique_checks=1")
+                            cursor.execute("SET SESSION foreign_key_checks=1")
+                        except Exception:
+                            # Connection is broken; get_connection discards it
+                            pass
+
                     logger.info(f"Saved detection results for image {image_id}")
-                    
+
         except Exception as e:
             logger.error(f"Failed to save detection results: {e}")
             raise
+
+    def _save_detection_rows(self, cursor, image_id: int, rekognition_results: Dict):
+        """Issue the batched INSERTs for one image's detection results"""
+        # Save general labels
+        label_rows = [
+            (image_id, label['Name'], label['Confidence'])
+            for label in rekognition_results.get('labels', [])
+        ]
+        if label_rows:
+            self._insert_batch(
+                cursor, 'detection_labels',
+                ('image_id', 'label_name', 'confidence'),
+                label_rows
+            )
+
+        # Save person detections
+        person_rows = [
+            (image_id, person['confidence'], *_get_bbox(person['boundingBox']))
+            for person in rekognition_results.get('boundingBoxes', [])
+        ]
+        if person_rows:
+            self._insert_batch(
+                cursor, 'person_detections',
+                ('image_id', 'confidence', 'bbox_left', 'bbox_top', 'bbox_width', 'bbox_height'),
+                person_rows
+            )
+
+        # Save face detections
+        face_rows = []
+        emotions_per_face = []
+        for face in rekognition_results.get('faceBoxes', []):
+            # Single lookup per optional attribute - the old per-field
+            # face.get('x', {}).get(...) chains allocated a throwaway
+            # dict on every missing key
+            age = face.get('ageRange') or {}
+            gender = face.get('gender') or {}
+            emotions = face.get('emotions') or ()
+            primary = emotions[0] if emotions else {}
+
+            face_rows.append((
+                image_id, face['confidence'],
+                *_get_bbox(face['boundingBox']),
+                age.get('Low'), age.get('High'),
+                gender.get('Value'), gender.get('Confidence'),
+                primary.get('Type'), primary.get('Confidence')
+            ))
+            emotions_per_face.append(emotions)
+
+        if face_rows:
+            # One insert (not chunked) so the faces get one
+            # contiguous AUTO_INCREMENT range and lastrowid is the
+            # first id (innodb_autoinc_lock_mode <= 1)
+            cursor.executemany(_SQL_INSERT_FACE, face_rows)
+            first_face_id = cursor.lastrowid
+
+            # Insert all emotions for all faces in one batch
+            emotion_rows = [
+                (first_face_id + i, emotion['Type'], emotion['Confidence'])
+                for i, emotions in enumerate(emotions_per_face)
+                for emotion in emotions
+            ]
+            if emotion_rows:
+                self._insert_batch(
+                    cursor, 'face_emotions',
+                    ('face_detection_id', 'emotion_type', 'confidence'),
+                    emotion_rows
+                )
     
     def get_image_by_s3_key(self, s3_key: str) -> Optional[Dict]:
-        """Get image record by S3 key"""
+        """Get image record by S3 key (cached for a couple of seconds)"""
+        with self._cache_lock:
+            cached = self._image_cache.get(s3_key)
+        if cached is not None:
+            return cached
+
         try:
-            with self.get_connection() as conn:
+            with self.get_read_connection() as conn:
                 with conn.cursor() as cursor:
                     sql = "SELECT * FROM images WHERE s3_key = %s"
                     cursor.execute(sql, (s3_key,))
-                    return cursor.fetchone()
+                    result = cursor.fetchone()
+                    if result is not None:
+                        with self._cache_lock:
+                            self._image_cache[s3_key] = result
+                    return result
         except Exception as e:
             logger.error(f"Failed to get image by S3 key: {e}")
             return None
     
     def get_all_images_with_detections(self) -> List[Dict]:
-        """Get all images with their detection results"""
+        """Get all images with their detection results.
+
+        Child rows are fetched with one IN query per table over the full
+        image id set and grouped in Python, so the call costs a constant
+        five round trips instead of three per image.
+        """
         try:
-            with self.get_connection() as conn:
+            with self.get_read_connection() as conn:
+                # Get basic image info with counts. An unbuffered server-side
+                # cursor streams rows as they arrive instead of materializing
+                # the full result set in the driver before iteration starts;
+                # it must be exhausted before the connection runs the child
+                # queries below, which the list build does.
+                sql = """
+                SELECT
+                    i.*,
+                    COUNT(DISTINCT pd.id) as person_count,
+                    COUNT(DISTINCT fd.id) as face_count,
+                    COUNT(DISTINCT dl.id) as label_count
+                FROM images i
+                LEFT JOIN person_detections pd ON i.id = pd.image_id
+                LEFT JOIN face_detections fd ON i.id = fd.image_id
+                LEFT JOIN detection_labels dl ON i.id = dl.image_id
+                GROUP BY i.id
+                ORDER BY i.upload_time DESC
+                """
+                with conn.cursor(pymysql.cursors.SSDictCursor) as stream_cursor:
+                    stream_cursor.execute(sql)
+                    images = [row for row in stream_cursor]
+
                 with conn.cursor() as cursor:
-                    # Get basic image info with counts
-                    sql = """
-                    SELECT 
-                        i.*,
-                        COUNT(DISTINCT pd.id) as person_count,
-                        COUNT(DISTINCT fd.id) as face_count,
-                        COUNT(DISTINCT dl.id) as label_count
-                    FROM images i
-                    LEFT JOIN person_detections pd ON i.id = pd.image_id
-                    LEFT JOIN face_detections fd ON i.id = fd.image_id  
-                    LEFT JOIN detection_labels dl ON i.id = dl.image_id
-                    GROUP BY i.id
-                    ORDER BY i.upload_time DESC
-                    """
-                    cursor.execute(sql)
-                    images = cursor.fetchall()
-                    
-                    # Get detailed detection data for each image
+                    if not images:
+                        return []
+
+                    image_ids = tuple(image['id'] for image in images)
+
+                    # Get labels for all images
+                    cursor.execute("""
+                        SELECT image_id, label_name, confidence
+                        FROM detection_labels WHERE image_id IN %s
+                    """, (image_ids,))
+                    labels_by_image = defaultdict(list)
+                    for row in cursor.fetchall():
+                        labels_by_image[row['image_id']].append(row)
+
+                    # Get person detections for all images
+                    cursor.execute("""
+                        SELECT image_id, confidence, bbox_left, bbox_top, bbox_width, bbox_height
+                        FROM person_detections WHERE image_id IN %s
+                    """, (image_ids,))
+                    persons_by_image = defaultdict(list)
+                    for row in cursor.fetchall():
+                        persons_by_image[row['image_id']].append(row)
+
+                    # Get face detections for all images, naming only the
+                    # columns the API serializes - the wire protocol sends
+                    # every selected column for every row, so SELECT * pays
+                    # for timestamps nobody reads. Emotions come from a
+                    # separate batched query grouped in Python - GROUP_CONCAT
+                    # packing silently truncates at group_concat_max_len and
+                    # makes the server build a string per face.
+                    cursor.execute("""
+                        SELECT id, image_id, confidence,
+                               bbox_left, bbox_top, bbox_width, bbox_height,
+                               age_low, age_high, gender, gender_confidence,
+                               primary_emotion, emotion_confidence
+                        FROM face_detections WHERE image_id IN %s
+                    """, (image_ids,))
+                    faces = cursor.fetchall()
+                    faces_by_image = defaultdict(list)
+                    for face in faces:
+                        faces_by_image[face['image_id']].append(face)
+
+                    emotions_by_face = defaultdict(list)
+                    if faces:
+                        face_ids = tuple(face['id'] for face in faces)
+                        cursor.execute("""
+                            SELECT face_detection_id, emotion_type, confidence
+                            FROM face_emotions WHERE face_detection_id IN %s
+                        """, (face_ids,))
+                        for row in cursor.fetchall():
+                            emotions_by_face[row['face_detection_id']].append(row)
+                    for face in faces:
+                        face['emotions'] = emotions_by_face.get(face['id'], [])
+
                     for image in images:
                         image_id = image['id']
-                        
-                        # Get labels
-                        cursor.execute(
-                            "SELECT label_name, confidence FROM detection_labels WHERE image_id = %s",
-                            (image_id,)
-                        )
-                        image['labels'] = cursor.fetchall()
-                        
-                        # Get person detections
-                        cursor.execute("""
-                            SELECT confidence, bbox_left, bbox_top, bbox_width, bbox_height
-                            FROM person_detections WHERE image_id = %s
-                        """, (image_id,))
-                        image['person_detections'] = cursor.fetchall()
-                        
-                        # Get face detections with emotions
-                        cursor.execute("""
-                            SELECT fd.*, GROUP_CONCAT(CONCAT(fe.emotion_type, ':', fe.confidence)) as emotions
-                            FROM face_detections fd
-                            LEFT JOIN face_emotions fe ON fd.id = fe.face_detection_id
-                            WHERE fd.image_id = %s
-                            GROUP BY fd.id
-                        """, (image_id,))
-                        image['face_detections'] = cursor.fetchall()
-                    
+                        image['labels'] = labels_by_image.get(image_id, [])
+                        image['person_detections'] = persons_by_image.get(image_id, [])
+                        image['face_detections'] = faces_by_image.get(image_id, [])
+
                     return images
-                    
+
         except Exception as e:
             logger.error(f"Failed to get images with detections: {e}")
             return []
@@ -293,65 +640,74 @@ class DatabaseManager:
         """Log processing events for monitoring"""
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    sql = """
-                    INSERT INTO processing_logs 
-                    (image_id, process_type, status, message, processing_time_ms)
-                    VALUES (%s, %s, %s, %s, %s)
-                    """
-                    cursor.execute(sql, (image_id, process_type, status, message, processing_time_ms))
+                with conn.cursor(pymysql.cursors.Cursor) as cursor:
+                    cursor.execute(_SQL_INSERT_LOG, (image_id, process_type, status, message, processing_time_ms))
                     conn.commit()
         except Exception as e:
             logger.error(f"Failed to log processing event: {e}")
 
     def get_processing_status(self, image_id):
-        """Get processing status for a specific image"""
+        """Get processing status for a specific image (cached for a couple of seconds)"""
+        # The Flask route passes the path segment as a string; normalize so
+        # cache entries live under the same int key the writers invalidate
         try:
-            with self.get_connection() as conn:
+            image_id = int(image_id)
+        except (TypeError, ValueError):
+            return None
+        with self._cache_lock:
+            cached = self._status_cache.get(image_id)
+        if cached is not None:
+            return cached
+
+        try:
+            with self.get_read_connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute("""
                         SELECT processing_status, processed_at, upload_time
-                        FROM images 
+                        FROM images
                         WHERE id = %s
                     """, (image_id,))
-                    
+
+                    # Connections use DictCursor, so rows come back as dicts
                     result = cursor.fetchone()
-                    if result:
-                        return {
-                            'processing_status': result[0],
-                            'processed_at': result[1],
-                            'upload_time': result[2]
-                        }
-                    return None
-                    
+                    if result is not None:
+                        with self._cache_lock:
+                            self._status_cache[image_id] = result
+                    return result
+
         except Exception as e:
             logger.error(f"Error getting processing status: {e}")
             return None
 
-    def update_processing_status(self, image_id, status, processed_at=None):
-        """Update processing status for an image"""
+    def get_processing_status_bulk(self, image_ids: List) -> List[Dict]:
+        """Get processing status for multiple images in one query"""
+        if not image_ids:
+            return []
         try:
-            with self.get_connection() as conn:
+            with self.get_read_connection() as conn:
                 with conn.cursor() as cursor:
-                    if processed_at:
-                        cursor.execute("""
-                            UPDATE images 
-                            SET processing_status = %s, processed_at = %s
-                            WHERE id = %s
-                        """, (status, processed_at, image_id))
-                    else:
-                        cursor.execute("""
-                            UPDATE images 
-                            SET processing_status = %s
-                            WHERE id = %s
-                        """, (status, image_id))
-                    
-                    conn.commit()
-                    logger.info(f"Updated processing status for image {image_id}: {status}")
-                    
+                    cursor.execute("""
+                        SELECT id, processing_status, processed_at, upload_time
+                        FROM images
+                        WHERE id IN %s
+                    """, (tuple(image_ids),))
+                    return cursor.fetchall()
+
         except Exception as e:
-            logger.error(f"Error updating processing status: {e}")
-            raise
+            logger.error(f"Error getting bulk processing status: {e}")
+            return []
+
+# Global database manager instance, built on first use so importing this
+# module (tests, CLI tools) costs nothing and logs nothing
+_db_manager = None
+_db_manager_lock = threading.Lock()
+
 
-# Global database manager instance
-db_manager = DatabaseManager()
+def get_db_manager() -> DatabaseManager:
+    """Return the shared DatabaseManager, creating it on first call"""
+    global _db_manager
+    if _db_manager is None:
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
+    return _db_manager
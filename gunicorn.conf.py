@@ -0,0 +1,15 @@
+"""Gunicorn configuration for the pedestrian detection backend.
+
+gevent workers cooperatively multitask the boto3/PyMySQL network waits, so
+hundreds of I/O-bound requests can be in flight instead of one at a time
+under Flask's dev server. Run with: gunicorn -c gunicorn.conf.py app:app
+"""
+
+bind = '0.0.0.0:5000'
+worker_class = 'gevent'
+workers = 2
+worker_connections = 1000
+keepalive = 75
+
+# Tells app.py to gevent-monkey-patch the stdlib before its other imports
+raw_env = ['GUNICORN_WORKER=1']